@@ -1,8 +1,12 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import codecs
+import contextlib
 import ctypes
 import json
 import os
+import re
 import subprocess
 import sys
 import tempfile
@@ -10,18 +14,34 @@ import time
 import winreg
 
 try:
-    from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QRectF, Qt, QTimer, pyqtProperty
-    from PyQt6.QtGui import QColor, QFont, QLinearGradient, QPainter
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from PyQt6.QtCore import (
+        QEasingCurve,
+        QEvent,
+        QFileSystemWatcher,
+        QObject,
+        QRectF,
+        Qt,
+        QThread,
+        QTimer,
+        pyqtSignal,
+        pyqtSlot,
+    )
+    from PyQt6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPixmap
     from PyQt6.QtWidgets import (
         QApplication,
         QComboBox,
         QFrame,
-        QGraphicsDropShadowEffect,
         QHBoxLayout,
         QLabel,
         QLineEdit,
         QMainWindow,
-        QMessageBox,
         QPushButton,
         QScrollArea,
         QSizePolicy,
@@ -31,18 +51,27 @@ try:
 
     PYQT_VER = 6
 except ImportError:
-    from PyQt5.QtCore import QEasingCurve, QPropertyAnimation, QRectF, Qt, QTimer, pyqtProperty
-    from PyQt5.QtGui import QColor, QFont, QLinearGradient, QPainter
+    from PyQt5.QtCore import (
+        QEasingCurve,
+        QEvent,
+        QFileSystemWatcher,
+        QObject,
+        QRectF,
+        Qt,
+        QThread,
+        QTimer,
+        pyqtSignal,
+        pyqtSlot,
+    )
+    from PyQt5.QtGui import QColor, QFont, QLinearGradient, QPainter, QPixmap
     from PyQt5.QtWidgets import (
         QApplication,
         QComboBox,
         QFrame,
-        QGraphicsDropShadowEffect,
         QHBoxLayout,
         QLabel,
         QLineEdit,
         QMainWindow,
-        QMessageBox,
         QPushButton,
         QScrollArea,
         QSizePolicy,
@@ -55,6 +84,120 @@ except ImportError:
 USB_ENUM_ROOT = r"SYSTEM\CurrentControlSet\Enum\USB"
 REFRESH_INTERVAL_MS = 3000
 PENDING_TIMEOUT_SEC = 75
+RESULT_POLL_FALLBACK_MS = 250
+RESULT_READ_SIZE = 65536
+RESULT_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+RESULT_BOM = codecs.BOM_UTF8
+RESULT_SUCCESS_RE = re.compile(rb'"success"\s*:\s*(true|false)')
+RESULT_MESSAGE_RE = re.compile(rb'"message"\s*:\s*"((?:[^"\\]|\\.)*)"')
+STATIC_BG_ENV = "USBPF_STATIC_BG"
+ENUM_WORKERS = 8
+PARENT_VALUE_NAMES = ("FriendlyName", "BusReportedDeviceDesc", "DeviceDesc", "Class", "Service", "Mfg")
+FLOW_MIN_INTERVAL_MS = 33
+FLOW_PHASE_PER_SEC = 0.18
+FILTER_DEBOUNCE_MS = 150
+TOGGLE_ANIM_MS = 170
+TOGGLE_FRAME_MS = 16
+CARD_POOL_MAX = 128
+
+APP_STYLESHEET = """
+QMainWindow { background: transparent; }
+QMenuBar { background-color: #09131f; color: #d8ebf8; }
+QMenuBar::item:selected { background-color: rgba(37, 99, 235, 115); }
+QMenu {
+    background-color: rgba(15, 27, 43, 240);
+    color: #d8ebf8;
+    border: 1px solid rgba(129, 182, 220, 80);
+}
+QMenu::item:selected { background-color: rgba(37, 99, 235, 165); }
+QFrame#headerFrame {
+    background-color: rgba(10, 19, 33, 190);
+    border: 1px solid rgba(118, 191, 255, 70);
+    border-radius: 14px;
+}
+QLabel#appTitle {
+    font-size: 24px;
+    font-weight: 700;
+    color: #e2f3ff;
+    letter-spacing: 0.4px;
+}
+QLabel#appSubtitle { font-size: 12px; color: #9fc8df; }
+QLabel#globalStatus { font-size: 12px; color: #b5d8eb; min-width: 300px; }
+QPushButton {
+    border-radius: 10px;
+    padding: 9px 14px;
+    font-weight: 600;
+}
+QPushButton#primaryBtn {
+    color: #e9fff8;
+    border: 1px solid #2dd4bf;
+    background-color: rgba(13, 148, 136, 140);
+}
+QPushButton#primaryBtn:hover { background-color: rgba(15, 170, 155, 190); }
+QPushButton#secondaryBtn {
+    color: #e6f2ff;
+    border: 1px solid #60a5fa;
+    background-color: rgba(37, 99, 235, 115);
+}
+QPushButton#secondaryBtn:hover { background-color: rgba(37, 99, 235, 165); }
+QLineEdit#searchInput, QComboBox#filterCombo {
+    background-color: rgba(15, 27, 43, 210);
+    color: #d8ebf8;
+    border: 1px solid rgba(129, 182, 220, 80);
+    border-radius: 9px;
+    padding: 8px;
+    min-height: 16px;
+}
+QScrollArea#deviceScroll { border: none; background: transparent; }
+QFrame#deviceCard {
+    background-color: rgba(15, 27, 43, 198);
+    border: 1px solid rgba(129, 182, 220, 65);
+    border-bottom: 3px solid rgba(0, 0, 0, 90);
+    border-radius: 12px;
+}
+QLabel#deviceTitle { font-size: 14px; font-weight: 650; color: #d4ecff; }
+QLabel#typeTag {
+    font-size: 11px;
+    font-weight: 700;
+    color: #cffafe;
+    background-color: rgba(8, 145, 178, 145);
+    border-radius: 7px;
+    padding: 3px 8px;
+}
+QLabel#pathLabel { font-family: Consolas; font-size: 11px; color: #90aec4; }
+QLabel#statusLabel {
+    font-size: 12px;
+    font-weight: 700;
+    padding: 4px 8px;
+    border-radius: 7px;
+    color: #d8eaff;
+    background-color: rgba(71, 85, 105, 160);
+}
+QLabel#statusLabel[state="off"] { color: #d1fae5; background-color: rgba(22, 163, 74, 140); }
+QLabel#statusLabel[state="on"] { color: #e2e8f0; background-color: rgba(71, 85, 105, 160); }
+QLabel#statusLabel[state="na"] { color: #f8d9b8; background-color: rgba(194, 110, 24, 150); }
+"""
+
+OUT_CUBIC = QEasingCurve.Type.OutCubic if PYQT_VER == 6 else QEasingCurve.OutCubic
+EASING_TABLE = [QEasingCurve(OUT_CUBIC).valueForProgress(i / 20) for i in range(21)]
+
+
+_message_box = None
+
+
+def message_box():
+    global _message_box
+    if _message_box is None:
+        if PYQT_VER == 6:
+            from PyQt6.QtWidgets import QMessageBox
+        else:
+            from PyQt5.QtWidgets import QMessageBox
+        _message_box = QMessageBox
+    return _message_box
+
+
+def show_critical(parent, title: str, text: str):
+    message_box().critical(parent, title, text)
 
 
 def align_left_vcenter():
@@ -73,6 +216,10 @@ def is_access_denied(exc: OSError) -> bool:
     return getattr(exc, "winerror", None) == 5
 
 
+def is_sharing_violation(exc: OSError) -> bool:
+    return getattr(exc, "winerror", None) in (32, 33)
+
+
 def read_reg_value(path: str, name: str):
     try:
         with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ) as key:
@@ -82,41 +229,52 @@ def read_reg_value(path: str, name: str):
         return None
 
 
+def read_reg_values(key_handle, names) -> Dict[str, object]:
+    values: Dict[str, object] = {}
+    for name in names:
+        try:
+            values[name] = winreg.QueryValueEx(key_handle, name)[0]
+        except OSError:
+            values[name] = None
+    return values
+
+
 def clean_registry_text(value) -> str:
-    if not isinstance(value, str):
+    if type(value) is not str:
         return ""
     text = value.strip()
     if not text:
         return ""
-    if ";" in text:
-        tail = text.split(";", 1)[1].strip()
+    _, sep, tail = text.partition(";")
+    if sep:
+        tail = tail.strip()
         if tail:
             return tail
     return text.lstrip("@").strip()
 
 
-def select_display_name(parent_path: str) -> str:
-    friendly = clean_registry_text(read_reg_value(parent_path, "FriendlyName"))
+def select_display_name(values: Dict[str, object]) -> str:
+    friendly = clean_registry_text(values.get("FriendlyName"))
     if friendly:
         return friendly
 
-    bus_desc = clean_registry_text(read_reg_value(parent_path, "BusReportedDeviceDesc"))
+    bus_desc = clean_registry_text(values.get("BusReportedDeviceDesc"))
     if bus_desc:
         return bus_desc
 
-    desc = clean_registry_text(read_reg_value(parent_path, "DeviceDesc"))
+    desc = clean_registry_text(values.get("DeviceDesc"))
     if desc:
         return desc
 
     return "Unknown USB device"
 
 
-def select_device_type(parent_path: str, key_path: str) -> str:
-    class_name = clean_registry_text(read_reg_value(parent_path, "Class"))
+def select_device_type(values: Dict[str, object], key_path: str) -> str:
+    class_name = clean_registry_text(values.get("Class"))
     if class_name:
         return class_name
 
-    service = clean_registry_text(read_reg_value(parent_path, "Service"))
+    service = clean_registry_text(values.get("Service"))
     if service:
         return service
 
@@ -128,32 +286,59 @@ def select_device_type(parent_path: str, key_path: str) -> str:
     return "Other"
 
 
-def enumerate_device_parameter_paths() -> List[str]:
+def list_subkey_names(key_handle) -> List[str]:
+    names: List[str] = []
+    try:
+        n_sub = winreg.QueryInfoKey(key_handle)[0]
+        for index in range(n_sub):
+            names.append(winreg.EnumKey(key_handle, index))
+    except OSError:
+        pass
+    return names
+
+
+def walk_subtree(root_path: str) -> List[str]:
     paths: List[str] = []
+    stack = [root_path]
 
-    def walk(key_handle, key_path: str):
-        index = 0
-        while True:
-            try:
-                child_name = winreg.EnumKey(key_handle, index)
-            except OSError:
-                break
-            index += 1
-            child_path = f"{key_path}\\{child_name}"
+    while stack:
+        key_path = stack.pop()
+        try:
+            key_handle = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path, 0, winreg.KEY_READ)
+        except OSError:
+            if key_path == root_path:
+                raise
+            continue
 
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, child_path, 0, winreg.KEY_READ) as child_key:
-                    if child_name.lower() == "device parameters":
-                        paths.append(child_path)
-                    walk(child_key, child_path)
-            except PermissionError:
-                continue
-            except OSError:
-                continue
+        try:
+            if key_path.rsplit("\\", 1)[-1].lower() == "device parameters":
+                paths.append(key_path)
+            children = list_subkey_names(key_handle)
+        finally:
+            winreg.CloseKey(key_handle)
+
+        stack.extend(f"{key_path}\\{name}" for name in reversed(children))
+
+    return paths
 
+
+def walk_subtree_or_empty(root_path: str) -> List[str]:
+    try:
+        return walk_subtree(root_path)
+    except OSError:
+        return []
+
+
+def enumerate_device_parameter_paths() -> List[str]:
     with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, USB_ENUM_ROOT, 0, winreg.KEY_READ) as root_key:
-        walk(root_key, USB_ENUM_ROOT)
+        children = list_subkey_names(root_key)
+
+    with ThreadPoolExecutor(max_workers=ENUM_WORKERS) as pool:
+        futures = [pool.submit(walk_subtree_or_empty, f"{USB_ENUM_ROOT}\\{child}") for child in children]
 
+    paths: List[str] = []
+    for future in futures:
+        paths.extend(future.result())
     return paths
 
 
@@ -177,6 +362,16 @@ def disable_epm_for_all() -> int:
     return failures
 
 
+def parse_result_payload(raw: memoryview) -> Tuple[bool, str]:
+    success = RESULT_SUCCESS_RE.search(raw)
+    message = RESULT_MESSAGE_RE.search(raw)
+    if success is not None and message is not None and b"\\" not in message.group(1):
+        return success.group(1) == b"true", message.group(1).decode("utf-8")
+
+    data = json_loads(bytes(raw))
+    return bool(data.get("success")), str(data.get("message", ""))
+
+
 def shell_quote_ps(value: str) -> str:
     return value.replace("'", "''")
 
@@ -197,6 +392,18 @@ class USBDevice:
     manufacturer: str
     device_type: str
     epm_value: Optional[int]
+    _desc_lc: str = field(init=False, repr=False, compare=False)
+    _mfg_lc: str = field(init=False, repr=False, compare=False)
+    _kp_lc: str = field(init=False, repr=False, compare=False)
+    _type_lc: str = field(init=False, repr=False, compare=False)
+    _search_blob: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._desc_lc = self.device_desc.lower()
+        self._mfg_lc = self.manufacturer.lower()
+        self._kp_lc = self.key_path.lower()
+        self._type_lc = self.device_type.lower()
+        self._search_blob = "\0".join((self._desc_lc, self._mfg_lc, self._kp_lc, self._type_lc))
 
     @property
     def sleep_disabled(self) -> Optional[bool]:
@@ -205,33 +412,167 @@ class USBDevice:
         return self.epm_value == 0
 
 
+STATE_RANK = {True: 0, False: 1, None: 2}
+
+SORT_MODES = [
+    ("Name A-Z", lambda d: (d._desc_lc, d._kp_lc), False),
+    ("Name Z-A", lambda d: (d._desc_lc, d._kp_lc), True),
+    ("State", lambda d: (STATE_RANK[d.sleep_disabled], d._desc_lc), False),
+    ("Type", lambda d: (d._type_lc, d._desc_lc), False),
+    ("Manufacturer", lambda d: (d._mfg_lc, d._desc_lc), False),
+]
+
+
+def scan_usb_devices(device_cache: Dict[str, Tuple[int, USBDevice]]) -> List[USBDevice]:
+    devices: List[USBDevice] = []
+    fresh: Dict[str, Tuple[int, USBDevice]] = {}
+    for child_path in enumerate_device_parameter_paths():
+        parent_path = child_path.rsplit("\\", 1)[0]
+        cached = device_cache.get(child_path)
+        stamp = None
+        values: Dict[str, object] = {}
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, parent_path, 0, winreg.KEY_READ) as parent_key:
+                stamp = winreg.QueryInfoKey(parent_key)[2]
+                if cached is None or cached[0] != stamp:
+                    values = read_reg_values(parent_key, PARENT_VALUE_NAMES)
+        except OSError:
+            pass
+
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            desc = cached[1].device_desc
+            mfg = cached[1].manufacturer
+            dtype = cached[1].device_type
+        else:
+            desc = select_display_name(values)
+            mfg = clean_registry_text(values.get("Mfg"))
+            dtype = select_device_type(values, child_path)
+        epm = read_reg_value(child_path, "EnhancedPowerManagementEnabled")
+        epm_value = epm if isinstance(epm, int) else None
+        device = USBDevice(
+            key_path=child_path,
+            parent_path=parent_path,
+            device_desc=desc,
+            manufacturer=str(mfg),
+            device_type=dtype,
+            epm_value=epm_value,
+        )
+        devices.append(device)
+        if stamp is not None:
+            fresh[child_path] = (stamp, device)
+
+    device_cache.clear()
+    device_cache.update(fresh)
+    devices.sort(key=SORT_MODES[0][1])
+    return devices
+
+
+class ScanWorker(QObject):
+    finished = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self._device_cache: Dict[str, Tuple[int, USBDevice]] = {}
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            devices = scan_usb_devices(self._device_cache)
+        except PermissionError:
+            self.failed.emit("Read failed: run as Administrator")
+            return
+        except OSError as exc:
+            self.failed.emit(f"Read failed: {exc}")
+            return
+        self.finished.emit(devices)
+
+
+def render_base_pixmap(width: int, height: int, ratio: float = 1.0) -> QPixmap:
+    w = max(width, 1)
+    h = max(height, 1)
+    pixmap = QPixmap(max(int(w * ratio), 1), max(int(h * ratio), 1))
+    pixmap.setDevicePixelRatio(ratio)
+
+    base = QLinearGradient(0, 0, w, h)
+    base.setColorAt(0.0, QColor("#09131f"))
+    base.setColorAt(0.45, QColor("#0e2537"))
+    base.setColorAt(1.0, QColor("#132b40"))
+
+    painter = QPainter(pixmap)
+    painter.fillRect(0, 0, w, h, base)
+    painter.end()
+    return pixmap
+
+
 class FlowBackgroundWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._phase = 0.0
+        self._interval = FLOW_MIN_INTERVAL_MS
+        self._animation_enabled = True
+        self._base_pixmap: Optional[QPixmap] = None
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._tick)
-        self._timer.start(33)
+
+    def frame_interval(self) -> int:
+        screen = self.screen()
+        rate = int(screen.refreshRate()) if screen is not None else 0
+        if rate <= 0:
+            return FLOW_MIN_INTERVAL_MS
+        return max(1000 // rate, FLOW_MIN_INTERVAL_MS)
+
+    def set_animation_enabled(self, enabled: bool):
+        self._animation_enabled = bool(enabled)
+        self.sync_animation()
+        self.update()
+
+    def sync_animation(self):
+        window = self.window()
+        if (
+            not self._animation_enabled
+            or not self.isVisible()
+            or window.isMinimized()
+            or not window.isActiveWindow()
+        ):
+            self._timer.stop()
+            return
+        interval = self.frame_interval()
+        if not self._timer.isActive() or interval != self._interval:
+            self._interval = interval
+            self._timer.start(interval)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sync_animation()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._timer.stop()
 
     def _tick(self):
-        self._phase += 0.006
+        self._phase += FLOW_PHASE_PER_SEC * self._interval / 1000.0
         if self._phase > 1.0:
             self._phase = 0.0
         self.update()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._base_pixmap = None
+
     def paintEvent(self, event):
+        if self._base_pixmap is None:
+            self._base_pixmap = render_base_pixmap(self.width(), self.height(), self.devicePixelRatioF())
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.drawPixmap(0, 0, self._base_pixmap)
+        if not self._animation_enabled:
+            return
 
         w = max(self.width(), 1)
         h = max(self.height(), 1)
 
-        base = QLinearGradient(0, 0, w, h)
-        base.setColorAt(0.0, QColor("#09131f"))
-        base.setColorAt(0.45, QColor("#0e2537"))
-        base.setColorAt(1.0, QColor("#132b40"))
-        painter.fillRect(self.rect(), base)
-
         shift = self._phase
         flow1 = QLinearGradient(0, 0, w, h)
         flow1.setColorAt(max(0.0, shift - 0.25), QColor(37, 165, 255, 0))
@@ -246,7 +587,56 @@ class FlowBackgroundWidget(QWidget):
         flow2.setColorAt(min(1.0, shift2 + 0.22), QColor(84, 232, 209, 0))
         painter.fillRect(self.rect(), flow2)
 
-        super().paintEvent(event)
+
+def eased_progress(progress: float) -> float:
+    last = len(EASING_TABLE) - 1
+    pos = min(max(progress, 0.0), 1.0) * last
+    index = int(pos)
+    if index >= last:
+        return EASING_TABLE[last]
+    low = EASING_TABLE[index]
+    return low + (EASING_TABLE[index + 1] - low) * (pos - index)
+
+
+class SwitchAnimator(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._switches = set()
+        self._timer = QTimer(self)
+        self._timer.setInterval(TOGGLE_FRAME_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self, switch):
+        self._switches.add(switch)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self, switch):
+        self._switches.discard(switch)
+        if not self._switches:
+            self._timer.stop()
+
+    def _tick(self):
+        now = time.monotonic()
+        for switch in list(self._switches):
+            try:
+                done = switch.advance_animation(now)
+            except RuntimeError:
+                done = True
+            if done:
+                self._switches.discard(switch)
+        if not self._switches:
+            self._timer.stop()
+
+
+_switch_animator: Optional[SwitchAnimator] = None
+
+
+def switch_animator() -> SwitchAnimator:
+    global _switch_animator
+    if _switch_animator is None:
+        _switch_animator = SwitchAnimator(QApplication.instance())
+    return _switch_animator
 
 
 class ToggleSwitch(QWidget):
@@ -256,9 +646,9 @@ class ToggleSwitch(QWidget):
         self._checked = False
         self._enabled = True
         self._offset = 3.0
-        self._anim = QPropertyAnimation(self, b"offset", self)
-        self._anim.setDuration(170)
-        self._anim.setEasingCurve(QEasingCurve.Type.OutCubic if PYQT_VER == 6 else QEasingCurve.OutCubic)
+        self._anim_from = 3.0
+        self._anim_to = 3.0
+        self._anim_start = 0.0
         self.on_toggled = None
 
     def mousePressEvent(self, event):
@@ -271,28 +661,29 @@ class ToggleSwitch(QWidget):
     def setChecked(self, checked: bool, animated: bool = True):
         self._checked = bool(checked)
         target = float(self.width() - self.height() + 3) if self._checked else 3.0
-        self._anim.stop()
         if animated:
-            self._anim.setStartValue(self._offset)
-            self._anim.setEndValue(target)
-            self._anim.start()
+            self._anim_from = self._offset
+            self._anim_to = target
+            self._anim_start = time.monotonic()
+            switch_animator().start(self)
         else:
+            switch_animator().stop(self)
             self._offset = target
             self.update()
 
-    def setEnabledState(self, enabled: bool):
-        self._enabled = bool(enabled)
+    def advance_animation(self, now: float) -> bool:
+        progress = (now - self._anim_start) * 1000.0 / TOGGLE_ANIM_MS
+        self._offset = self._anim_from + (self._anim_to - self._anim_from) * eased_progress(progress)
         self.update()
+        return progress >= 1.0
 
-    def get_offset(self):
-        return self._offset
+    def isChecked(self) -> bool:
+        return self._checked
 
-    def set_offset(self, value):
-        self._offset = float(value)
+    def setEnabledState(self, enabled: bool):
+        self._enabled = bool(enabled)
         self.update()
 
-    offset = pyqtProperty(float, fget=get_offset, fset=set_offset)
-
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
@@ -320,22 +711,38 @@ class ToggleSwitch(QWidget):
         painter.drawEllipse(knob_rect)
 
 
+class ElidedLabel(QLabel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._full_text = ""
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
+
+    def setFullText(self, text: str):
+        self._full_text = text
+        self.setToolTip(text)
+        self._update_elided()
+
+    def _update_elided(self):
+        mode = Qt.TextElideMode.ElideMiddle if PYQT_VER == 6 else Qt.ElideMiddle
+        self.setText(self.fontMetrics().elidedText(self._full_text, mode, self.width()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self._update_elided()
+
+
 class DeviceCard(QFrame):
     def __init__(self, device: USBDevice, toggle_callback, parent=None):
         super().__init__(parent)
         self.device = device
         self.toggle_callback = toggle_callback
         self._updating = False
+        self._state: Optional[str] = None
 
         self.setObjectName("deviceCard")
         self.setFrameShape(QFrame.Shape.NoFrame if PYQT_VER == 6 else QFrame.NoFrame)
 
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 90))
-        self.setGraphicsEffect(shadow)
-
         outer = QVBoxLayout(self)
         outer.setContentsMargins(14, 12, 14, 12)
         outer.setSpacing(8)
@@ -362,9 +769,8 @@ class DeviceCard(QFrame):
         top.addWidget(self.status_label)
         top.addWidget(self.switch)
 
-        self.path_label = QLabel()
+        self.path_label = ElidedLabel()
         self.path_label.setObjectName("pathLabel")
-        self.path_label.setWordWrap(True)
 
         outer.addLayout(top)
         outer.addWidget(self.path_label)
@@ -377,6 +783,13 @@ class DeviceCard(QFrame):
         self.toggle_callback(self.device.key_path, checked)
 
     def update_from_device(self, device: USBDevice):
+        if (
+            self._state is not None
+            and device == self.device
+            and self.switch.isChecked() == bool(device.sleep_disabled)
+        ):
+            return
+
         self._updating = True
         self.device = device
 
@@ -384,30 +797,40 @@ class DeviceCard(QFrame):
         title = device.device_desc if device.device_desc else "Unknown USB device"
         self.title_label.setText(f"{title}  |  {subtitle}")
         self.type_label.setText(device.device_type)
-        self.path_label.setText(device.key_path)
+        self.path_label.setFullText(device.key_path)
 
         if device.epm_value is None:
+            state = "na"
             self.status_label.setText("Sleep: Unavailable")
-            self.status_label.setProperty("state", "na")
             self.switch.setEnabledState(False)
             self.switch.setChecked(False, animated=False)
         elif device.sleep_disabled:
+            state = "off"
             self.status_label.setText("Sleep: Disabled")
-            self.status_label.setProperty("state", "off")
             self.switch.setEnabledState(True)
             self.switch.setChecked(True, animated=False)
         else:
+            state = "on"
             self.status_label.setText("Sleep: Enabled")
-            self.status_label.setProperty("state", "on")
             self.switch.setEnabledState(True)
             self.switch.setChecked(False, animated=False)
 
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
+        if state != self._state:
+            self._state = state
+            self.status_label.setProperty("state", state)
+            self.status_label.style().unpolish(self.status_label)
+            self.status_label.style().polish(self.status_label)
         self._updating = False
 
 
 class USBPowerMainWindow(QMainWindow):
+    scan_requested = pyqtSignal()
+
+    _MSG_TIMEOUT = "Elevated operation timed out"
+    _MSG_UNREADABLE = "Elevated operation returned unreadable output"
+    _MSG_ACTION_FAILED = "Elevated action failed"
+    _MSG_RESULT_ERROR = "Elevation result error"
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("EZ USB Power")
@@ -415,11 +838,32 @@ class USBPowerMainWindow(QMainWindow):
 
         self.latest_devices: Dict[str, USBDevice] = {}
         self.cards: Dict[str, DeviceCard] = {}
+        self._card_pool: List[DeviceCard] = []
         self.pending_operation = None
-
+        self._scan_in_flight = False
+        self._scan_queued = False
+        self._scan_silent = True
+        self._type_filter_items: Tuple[str, ...] = ()
+
+        self._scan_thread = QThread(self)
+        self._scan_worker = ScanWorker()
+        self._scan_worker.moveToThread(self._scan_thread)
+        self.scan_requested.connect(self._scan_worker.run)
+        self._scan_worker.finished.connect(self.on_scan_finished)
+        self._scan_worker.failed.connect(self.on_scan_failed)
+        self._scan_thread.start()
+
+        animate_bg = os.environ.get(STATIC_BG_ENV, "") in ("", "0")
         self.bg = FlowBackgroundWidget()
+        self.bg.set_animation_enabled(animate_bg)
         self.setCentralWidget(self.bg)
 
+        view_menu = self.menuBar().addMenu("View")
+        self.animate_bg_action = view_menu.addAction("Animated Background")
+        self.animate_bg_action.setCheckable(True)
+        self.animate_bg_action.setChecked(animate_bg)
+        self.animate_bg_action.toggled.connect(self.bg.set_animation_enabled)
+
         root = QVBoxLayout(self.bg)
         root.setContentsMargins(18, 18, 18, 18)
         root.setSpacing(14)
@@ -466,7 +910,11 @@ class USBPowerMainWindow(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setObjectName("searchInput")
         self.search_input.setPlaceholderText("Search by name, manufacturer, or registry path")
-        self.search_input.textChanged.connect(self.apply_view_filters)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_view_filters)
+        self.search_input.textChanged.connect(lambda _text: self._filter_timer.start())
 
         self.type_filter = QComboBox()
         self.type_filter.setObjectName("filterCombo")
@@ -474,7 +922,7 @@ class USBPowerMainWindow(QMainWindow):
 
         self.sort_combo = QComboBox()
         self.sort_combo.setObjectName("filterCombo")
-        self.sort_combo.addItems(["Name A-Z", "Name Z-A", "State", "Type", "Manufacturer"])
+        self.sort_combo.addItems([label for label, _, _ in SORT_MODES])
         self.sort_combo.currentIndexChanged.connect(self.apply_view_filters)
 
         row2.addWidget(self.search_input, 1)
@@ -499,8 +947,11 @@ class USBPowerMainWindow(QMainWindow):
         self.scroll.setWidget(self.scroll_body)
         root.addWidget(self.scroll, 1)
 
-        self.pending_timer = QTimer(self)
-        self.pending_timer.timeout.connect(self.poll_pending_operation)
+        self._pending_epoch = 0
+        self._deferred_status: Optional[str] = None
+        self.result_poll_timer = QTimer(self)
+        self.result_poll_timer.timeout.connect(lambda: self.on_result_changed(""))
+        self._result_watcher: Optional[QFileSystemWatcher] = None
 
         self.apply_styles()
         self.refresh_devices()
@@ -509,129 +960,69 @@ class USBPowerMainWindow(QMainWindow):
         self.refresh_timer.timeout.connect(lambda: self.refresh_devices(silent=True))
         self.refresh_timer.start(REFRESH_INTERVAL_MS)
 
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        state_change = QEvent.Type.WindowStateChange if PYQT_VER == 6 else QEvent.WindowStateChange
+        activation_change = QEvent.Type.ActivationChange if PYQT_VER == 6 else QEvent.ActivationChange
+        if event.type() in (state_change, activation_change):
+            self.bg.sync_animation()
+
     def apply_styles(self):
-        app_font = QFont("Segoe UI", 10)
-        QApplication.instance().setFont(app_font)
-
-        self.setStyleSheet(
-            """
-            QMainWindow { background: transparent; }
-            QFrame#headerFrame {
-                background-color: rgba(10, 19, 33, 190);
-                border: 1px solid rgba(118, 191, 255, 70);
-                border-radius: 14px;
-            }
-            QLabel#appTitle {
-                font-size: 24px;
-                font-weight: 700;
-                color: #e2f3ff;
-                letter-spacing: 0.4px;
-            }
-            QLabel#appSubtitle { font-size: 12px; color: #9fc8df; }
-            QLabel#globalStatus { font-size: 12px; color: #b5d8eb; min-width: 300px; }
-            QPushButton {
-                border-radius: 10px;
-                padding: 9px 14px;
-                font-weight: 600;
-            }
-            QPushButton#primaryBtn {
-                color: #e9fff8;
-                border: 1px solid #2dd4bf;
-                background-color: rgba(13, 148, 136, 140);
-            }
-            QPushButton#primaryBtn:hover { background-color: rgba(15, 170, 155, 190); }
-            QPushButton#secondaryBtn {
-                color: #e6f2ff;
-                border: 1px solid #60a5fa;
-                background-color: rgba(37, 99, 235, 115);
-            }
-            QPushButton#secondaryBtn:hover { background-color: rgba(37, 99, 235, 165); }
-            QLineEdit#searchInput, QComboBox#filterCombo {
-                background-color: rgba(15, 27, 43, 210);
-                color: #d8ebf8;
-                border: 1px solid rgba(129, 182, 220, 80);
-                border-radius: 9px;
-                padding: 8px;
-                min-height: 16px;
-            }
-            QScrollArea#deviceScroll { border: none; background: transparent; }
-            QFrame#deviceCard {
-                background-color: rgba(15, 27, 43, 198);
-                border: 1px solid rgba(129, 182, 220, 65);
-                border-radius: 12px;
-            }
-            QLabel#deviceTitle { font-size: 14px; font-weight: 650; color: #d4ecff; }
-            QLabel#typeTag {
-                font-size: 11px;
-                font-weight: 700;
-                color: #cffafe;
-                background-color: rgba(8, 145, 178, 145);
-                border-radius: 7px;
-                padding: 3px 8px;
-            }
-            QLabel#pathLabel { font-family: Consolas; font-size: 11px; color: #90aec4; }
-            QLabel#statusLabel {
-                font-size: 12px;
-                font-weight: 700;
-                padding: 4px 8px;
-                border-radius: 7px;
-                color: #d8eaff;
-                background-color: rgba(71, 85, 105, 160);
-            }
-            QLabel#statusLabel[state="off"] { color: #d1fae5; background-color: rgba(22, 163, 74, 140); }
-            QLabel#statusLabel[state="on"] { color: #e2e8f0; background-color: rgba(71, 85, 105, 160); }
-            QLabel#statusLabel[state="na"] { color: #f8d9b8; background-color: rgba(194, 110, 24, 150); }
-            """
-        )
+        app = QApplication.instance()
+        app.setFont(QFont("Segoe UI", 10))
+        if app.property("_usbpf_css_applied") is None:
+            app.setStyleSheet(APP_STYLESHEET)
+            app.setProperty("_usbpf_css_applied", True)
+
+    def closeEvent(self, event):
+        self._scan_thread.quit()
+        self._scan_thread.wait()
+        super().closeEvent(event)
 
     def refresh_devices(self, silent: bool = False):
-        try:
-            devices = self.scan_usb_devices()
-        except PermissionError:
-            self.status_label.setText("Read failed: run as Administrator")
-            return
-        except OSError as exc:
-            self.status_label.setText(f"Read failed: {exc}")
+        if not silent:
+            self._scan_silent = False
+        if self._scan_in_flight:
+            self._scan_queued = True
             return
 
+        self._scan_in_flight = True
+        self.scan_requested.emit()
+
+    def start_queued_scan(self) -> bool:
+        self._scan_in_flight = self._scan_queued
+        self._scan_queued = False
+        if self._scan_in_flight:
+            self.scan_requested.emit()
+        return self._scan_in_flight
+
+    def on_scan_finished(self, devices: List[USBDevice]):
         self.latest_devices = {d.key_path: d for d in devices}
         self.refresh_type_filter_items()
         self.apply_view_filters()
 
-        if not silent:
+        if self.start_queued_scan():
+            return
+        if not self._scan_silent:
+            self._scan_silent = True
             self.status_label.setText(f"Loaded {len(devices)} USB device parameter entries")
 
-    def scan_usb_devices(self) -> List[USBDevice]:
-        devices: List[USBDevice] = []
-        for child_path in enumerate_device_parameter_paths():
-            parent_path = child_path.rsplit("\\", 1)[0]
-            desc = select_display_name(parent_path)
-            mfg = clean_registry_text(read_reg_value(parent_path, "Mfg")) or ""
-            dtype = select_device_type(parent_path, child_path)
-            epm = read_reg_value(child_path, "EnhancedPowerManagementEnabled")
-            epm_value = epm if isinstance(epm, int) else None
-            devices.append(
-                USBDevice(
-                    key_path=child_path,
-                    parent_path=parent_path,
-                    device_desc=desc,
-                    manufacturer=str(mfg),
-                    device_type=dtype,
-                    epm_value=epm_value,
-                )
-            )
-
-        devices.sort(key=lambda d: (d.device_desc.lower(), d.key_path.lower()))
-        return devices
+    def on_scan_failed(self, message: str):
+        self._scan_silent = True
+        self.status_label.setText(message)
+        self.start_queued_scan()
 
     def refresh_type_filter_items(self):
-        current = self.type_filter.currentText()
         types = sorted({d.device_type for d in self.latest_devices.values()}, key=lambda x: x.lower())
-        items = ["All Types"] + types
+        items = ("All Types", *types)
+        if items == self._type_filter_items:
+            return
+        self._type_filter_items = items
 
+        current = self.type_filter.currentText()
         self.type_filter.blockSignals(True)
         self.type_filter.clear()
-        self.type_filter.addItems(items)
+        self.type_filter.addItems(list(items))
 
         idx = self.type_filter.findText(current)
         if idx >= 0:
@@ -650,27 +1041,10 @@ class USBPowerMainWindow(QMainWindow):
             devices = [d for d in devices if d.device_type == selected_type]
 
         if query:
-            devices = [
-                d
-                for d in devices
-                if query in d.device_desc.lower()
-                or query in d.manufacturer.lower()
-                or query in d.key_path.lower()
-                or query in d.device_type.lower()
-            ]
-
-        sort_mode = self.sort_combo.currentText()
-        if sort_mode == "Name Z-A":
-            devices.sort(key=lambda d: (d.device_desc.lower(), d.key_path.lower()), reverse=True)
-        elif sort_mode == "State":
-            state_rank = {True: 0, False: 1, None: 2}
-            devices.sort(key=lambda d: (state_rank[d.sleep_disabled], d.device_desc.lower()))
-        elif sort_mode == "Type":
-            devices.sort(key=lambda d: (d.device_type.lower(), d.device_desc.lower()))
-        elif sort_mode == "Manufacturer":
-            devices.sort(key=lambda d: (d.manufacturer.lower(), d.device_desc.lower()))
-        else:
-            devices.sort(key=lambda d: (d.device_desc.lower(), d.key_path.lower()))
+            devices = [d for d in devices if query in d._search_blob]
+
+        _, sort_key, reverse = SORT_MODES[max(self.sort_combo.currentIndex(), 0)]
+        devices.sort(key=sort_key, reverse=reverse)
 
         return devices
 
@@ -678,24 +1052,40 @@ class USBPowerMainWindow(QMainWindow):
         ordered = self.filtered_sorted_devices()
         visible_paths = {d.key_path for d in ordered}
 
+        self.scroll_body.setUpdatesEnabled(False)
+
         stale = [path for path in self.cards if path not in visible_paths]
         for path in stale:
             card = self.cards.pop(path)
             self.scroll_layout.removeWidget(card)
-            card.setParent(None)
-            card.deleteLater()
+            if len(self._card_pool) < CARD_POOL_MAX:
+                card.hide()
+                self._card_pool.append(card)
+            else:
+                card.setParent(None)
+                card.deleteLater()
 
         for idx, device in enumerate(ordered):
             card = self.cards.get(device.key_path)
             if card is None:
-                card = DeviceCard(device, self.set_device_sleep_state)
+                if self._card_pool:
+                    card = self._card_pool.pop()
+                    card.update_from_device(device)
+                    card.show()
+                else:
+                    card = DeviceCard(device, self.set_device_sleep_state)
                 self.cards[device.key_path] = card
             else:
                 card.update_from_device(device)
+                if self.scroll_layout.indexOf(card) == idx:
+                    continue
 
             self.scroll_layout.removeWidget(card)
             self.scroll_layout.insertWidget(idx, card)
 
+        self.scroll_body.setUpdatesEnabled(True)
+        self.scroll_body.update()
+
         self.status_label.setText(
             f"Showing {len(ordered)} of {len(self.latest_devices)} USB device parameter entries"
         )
@@ -711,7 +1101,7 @@ class USBPowerMainWindow(QMainWindow):
             pass
         except OSError as exc:
             if not is_access_denied(exc):
-                QMessageBox.critical(self, "Registry error", f"Failed to update {key_path}\n\n{exc}")
+                show_critical(self, "Registry error", f"Failed to update {key_path}\n\n{exc}")
                 self.refresh_devices(silent=True)
                 return
 
@@ -724,11 +1114,12 @@ class USBPowerMainWindow(QMainWindow):
             self.refresh_devices(silent=True)
             return
 
-        result_path = self.make_result_file()
-        if not result_path:
-            QMessageBox.critical(self, "Error", "Could not allocate temporary result file for elevated action.")
+        result_file = self.make_result_file()
+        if not result_file:
+            show_critical(self, "Error", "Could not allocate temporary result file for elevated action.")
             self.refresh_devices(silent=True)
             return
+        result_path, result_dir = result_file
 
         key_escaped = shell_quote_ps(key_path)
         path = f"Registry::HKEY_LOCAL_MACHINE\\{key_escaped}"
@@ -744,6 +1135,7 @@ class USBPowerMainWindow(QMainWindow):
         self.start_pending_operation(
             command=ps,
             result_path=result_path,
+            result_dir=result_dir,
             user_status="Waiting for UAC approval...",
             success_status="Elevated write completed",
         )
@@ -765,7 +1157,7 @@ class USBPowerMainWindow(QMainWindow):
             pass
         except OSError as exc:
             if not is_access_denied(exc):
-                QMessageBox.critical(self, "Registry error", f"Disable-all failed.\n\n{exc}")
+                show_critical(self, "Registry error", f"Disable-all failed.\n\n{exc}")
                 self.refresh_devices(silent=True)
                 return
 
@@ -778,11 +1170,12 @@ class USBPowerMainWindow(QMainWindow):
             self.refresh_devices(silent=True)
             return
 
-        result_path = self.make_result_file()
-        if not result_path:
-            QMessageBox.critical(self, "Error", "Could not allocate temporary result file for elevated action.")
+        result_file = self.make_result_file()
+        if not result_file:
+            show_critical(self, "Error", "Could not allocate temporary result file for elevated action.")
             self.refresh_devices(silent=True)
             return
+        result_path, result_dir = result_file
 
         ps = (
             "$ErrorActionPreference='Continue';"
@@ -797,11 +1190,13 @@ class USBPowerMainWindow(QMainWindow):
         self.start_pending_operation(
             command=ps,
             result_path=result_path,
+            result_dir=result_dir,
             user_status="Waiting for UAC approval for disable-all...",
             success_status="Elevated disable-all completed",
         )
 
     def ask_yes_no(self, title: str, text: str) -> bool:
+        QMessageBox = message_box()
         if PYQT_VER == 6:
             choice = QMessageBox.question(
                 self,
@@ -821,85 +1216,134 @@ class USBPowerMainWindow(QMainWindow):
         )
         return choice == QMessageBox.Yes
 
-    def make_result_file(self) -> Optional[str]:
+    def make_result_file(self) -> Optional[Tuple[str, str]]:
         try:
             fd, path = tempfile.mkstemp(prefix="usb_power_flow_", suffix=".json")
             os.close(fd)
             os.unlink(path)
-            return path
+            return path, os.path.dirname(path)
         except OSError:
             return None
 
-    def start_pending_operation(self, command: str, result_path: str, user_status: str, success_status: str):
+    def start_pending_operation(
+        self, command: str, result_path: str, result_dir: str, user_status: str, success_status: str
+    ):
         if self.pending_operation is not None:
-            QMessageBox.warning(self, "Operation in progress", "Wait for the current elevated operation to finish.")
+            message_box().warning(self, "Operation in progress", "Wait for the current elevated operation to finish.")
             return
 
         launched = launch_elevated_powershell(command)
         if not launched:
-            QMessageBox.critical(self, "Elevation failed", "Could not launch elevated helper process.")
+            show_critical(self, "Elevation failed", "Could not launch elevated helper process.")
             return
 
         self.pending_operation = {
             "result_path": result_path,
             "success_status": success_status,
-            "started_at": time.time(),
+            "status_template_with_msg": success_status.replace("%", "%%") + " (%s)",
         }
+        self._result_watcher = QFileSystemWatcher(self)
+        self._result_watcher.directoryChanged.connect(self.on_result_changed)
+        self._result_watcher.fileChanged.connect(self.on_result_changed)
+        if not self._result_watcher.addPath(result_dir):
+            self.result_poll_timer.start(RESULT_POLL_FALLBACK_MS)
         self.status_label.setText(user_status)
-        self.pending_timer.start(400)
-
-    def poll_pending_operation(self):
-        if not self.pending_operation:
-            self.pending_timer.stop()
-            return
-
-        elapsed = time.time() - self.pending_operation["started_at"]
-        result_path = self.pending_operation["result_path"]
+        self._pending_epoch += 1
+        epoch = self._pending_epoch
+        QTimer.singleShot(PENDING_TIMEOUT_SEC * 1000, lambda: self.on_pending_timeout(epoch))
+
+    def end_pending_operation(self):
+        self._pending_epoch += 1
+        self.result_poll_timer.stop()
+        if self._result_watcher is not None:
+            self._result_watcher.deleteLater()
+            self._result_watcher = None
+        pending = self.pending_operation
+        self.pending_operation = None
+        return pending
 
-        if elapsed > PENDING_TIMEOUT_SEC:
-            self.pending_timer.stop()
-            self.pending_operation = None
-            self.status_label.setText("Elevated operation timed out")
-            self.refresh_devices(silent=True)
+    def on_pending_timeout(self, epoch: int):
+        if epoch != self._pending_epoch or not self.pending_operation:
             return
+        self.finalize_pending(("timeout",))
 
-        if not os.path.exists(result_path):
+    def on_result_changed(self, _path: str):
+        if not self.pending_operation:
             return
+        result = self.compute_pending_result()
+        if result is not None:
+            self.finalize_pending(result)
 
+    def compute_pending_result(self) -> Optional[tuple]:
+        pending = self.pending_operation
+        result_path = pending["result_path"]
         try:
-            with open(result_path, "r", encoding="utf-8-sig") as f:
-                raw = f.read().strip()
-            data = json.loads(raw) if raw else {}
-        except Exception as exc:
-            self.pending_timer.stop()
-            self.pending_operation = None
-            self.status_label.setText("Elevated operation returned unreadable output")
-            QMessageBox.critical(self, "Elevation result error", str(exc))
-            self.refresh_devices(silent=True)
-            return
-        finally:
+            fd = os.open(result_path, RESULT_OPEN_FLAGS)
             try:
-                os.remove(result_path)
-            except OSError:
-                pass
-
-        self.pending_timer.stop()
-        pending = self.pending_operation
-        self.pending_operation = None
+                raw = os.read(fd, RESULT_READ_SIZE)
+            finally:
+                os.close(fd)
+            payload = memoryview(raw)
+            if payload[:3] == RESULT_BOM:
+                payload = payload[3:]
+            if not payload:
+                self.wait_for_result_write(result_path)
+                return None
+            with contextlib.suppress(OSError):
+                os.unlink(result_path)
+            success, message = parse_result_payload(payload)
+        except FileNotFoundError:
+            return None
+        except PermissionError as exc:
+            if not is_sharing_violation(exc):
+                return ("unreadable", exc)
+            self.wait_for_result_write(result_path)
+            return None
+        except Exception as exc:
+            with contextlib.suppress(OSError):
+                os.unlink(result_path)
+            return ("unreadable", exc)
+
+        if not success:
+            return ("fail", message or self._MSG_ACTION_FAILED)
+        if message:
+            return ("ok", pending["status_template_with_msg"] % message)
+        return ("ok", pending["success_status"])
+
+    def wait_for_result_write(self, result_path: str):
+        if result_path not in self._result_watcher.files():
+            self._result_watcher.addPath(result_path)
+        if not self.result_poll_timer.isActive():
+            self.result_poll_timer.start(RESULT_POLL_FALLBACK_MS)
+
+    def finalize_pending(self, result: tuple):
+        self.end_pending_operation()
+        kind = result[0]
+        if kind == "timeout":
+            self.defer_status(self._MSG_TIMEOUT)
+        elif kind == "unreadable":
+            self.defer_status(self._MSG_UNREADABLE)
+            show_critical(self, self._MSG_RESULT_ERROR, str(result[1]))
+        elif kind == "ok":
+            self.defer_status(result[1])
+        else:
+            self.defer_status(self._MSG_ACTION_FAILED)
+            show_critical(self, self._MSG_ACTION_FAILED, result[1])
 
-        success = bool(data.get("success"))
-        message = str(data.get("message", ""))
+    def set_status(self, text: str):
+        if text != self.status_label.text():
+            self.status_label.setText(text)
 
-        if success:
-            label = pending["success_status"]
-            if message:
-                label = f"{label} ({message})"
-            self.status_label.setText(label)
-        else:
-            err = message or "Elevated action failed"
-            self.status_label.setText("Elevated action failed")
-            QMessageBox.critical(self, "Elevated action failed", err)
+    def defer_status(self, text: str):
+        self._deferred_status = text
+        QTimer.singleShot(0, self.flush_status)
 
+    def flush_status(self):
+        text = self._deferred_status
+        if text is None:
+            return
+        self._deferred_status = None
+        self.set_status(text)
         self.refresh_devices(silent=True)
 
 